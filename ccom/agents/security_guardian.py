@@ -4,6 +4,9 @@ Security Guardian Agent SDK Implementation v5.1
 Comprehensive security scanning and hardening for modern development
 """
 
+import os
+import re
+import mmap
 import asyncio
 import json
 import logging
@@ -12,7 +15,39 @@ from typing import Dict, List, Any, AsyncGenerator
 from datetime import datetime
 
 from .sdk_agent_base import SDKAgentBase, AgentResult, StreamingUpdate
-from ..utils import SubprocessRunner, ErrorHandler, Display
+from ..utils import SubprocessRunner, ErrorHandler, Display, FileUtils
+
+# Directories whose files _should_scan_file always rejects, pruned from the walk
+_SKIPPED_DIRS = frozenset({
+    "node_modules", ".git", "__pycache__", ".venv", "venv", "dist", "build", "coverage", "legacy"
+})
+
+
+def _walk_project_files(root: Path, patterns) -> List[Path]:
+    """Files under root matching "*<suffix>" patterns, grouped by pattern in the given
+    order like successive glob("**/<pattern>") calls, from one pruned walk"""
+    buckets = [(pattern[1:], []) for pattern in patterns]
+    for entry in FileUtils.walk_files(root, ignored=_SKIPPED_DIRS):
+        for suffix, bucket in buckets:
+            if entry.name.endswith(suffix):
+                bucket.append(Path(entry.path))
+    return [path for _, bucket in buckets for path in bucket]
+
+
+# JavaScript/TypeScript security anti-patterns: (pattern, description, severity)
+_JS_DANGEROUS_PATTERNS = (
+    (r'eval\s*\(', "Use of eval() function", "HIGH"),
+    (r'innerHTML\s*=', "Direct innerHTML assignment", "MEDIUM"),
+    (r'document\.write\s*\(', "Use of document.write", "MEDIUM"),
+    (r'setTimeout\s*\(\s*["\']', "String-based setTimeout", "MEDIUM"),
+)
+# All patterns in one compiled scan; group g<i> names the pattern that matched.
+# The patterns are pure ASCII, so it runs over raw file bytes with no decode pass
+_JS_SECURITY_RE = re.compile(
+    ("(?=" + "|".join(
+        f"(?P<g{i}>{pattern})" for i, (pattern, _, _) in enumerate(_JS_DANGEROUS_PATTERNS)
+    ) + ")").encode("ascii")
+)
 
 
 class SecurityGuardianAgent(SDKAgentBase):
@@ -313,12 +348,11 @@ class SecurityGuardianAgent(SDKAgentBase):
             ]
 
             files_scanned = 0
-            for pattern in files_to_scan:
-                for file_path in self.project_root.glob(f"**/{pattern}"):
-                    if self._should_scan_file(file_path):
-                        secrets_in_file = self._scan_file_for_secrets(file_path, secret_patterns)
-                        result["patterns_detected"].extend(secrets_in_file)
-                        files_scanned += 1
+            for file_path in _walk_project_files(self.project_root, files_to_scan):
+                if self._should_scan_file(file_path):
+                    secrets_in_file = self._scan_file_for_secrets(file_path, secret_patterns)
+                    result["patterns_detected"].extend(secrets_in_file)
+                    files_scanned += 1
 
             result["files_scanned"] = files_scanned
             result["secrets_found"] = len(result["patterns_detected"])
@@ -389,13 +423,14 @@ class SecurityGuardianAgent(SDKAgentBase):
 
         try:
             # Run bandit for Python security analysis
-            python_files = list(self.project_root.glob("**/*.py"))
+            # Existence checks only - stop at the first match
+            python_files = any(self.project_root.glob("**/*.py"))
             if python_files:
                 bandit_result = await self._run_bandit_analysis()
                 result.update(bandit_result)
 
             # Add JavaScript/TypeScript security checks if needed
-            js_files = list(self.project_root.glob("**/*.js")) + list(self.project_root.glob("**/*.ts"))
+            js_files = any(self.project_root.glob("**/*.js")) or any(self.project_root.glob("**/*.ts"))
             if js_files:
                 js_result = await self._analyze_js_security()
                 result = self._merge_security_results(result, js_result)
@@ -443,18 +478,11 @@ class SecurityGuardianAgent(SDKAgentBase):
         }
 
         try:
-            js_files = list(self.project_root.glob("**/*.js")) + list(self.project_root.glob("**/*.ts"))
-
-            dangerous_patterns = [
-                (r'eval\s*\(', "Use of eval() function", "HIGH"),
-                (r'innerHTML\s*=', "Direct innerHTML assignment", "MEDIUM"),
-                (r'document\.write\s*\(', "Use of document.write", "MEDIUM"),
-                (r'setTimeout\s*\(\s*["\']', "String-based setTimeout", "MEDIUM")
-            ]
+            js_files = _walk_project_files(self.project_root, ("*.js", "*.ts"))
 
             for file_path in js_files:
                 if self._should_scan_file(file_path):
-                    issues_in_file = self._scan_js_file_security(file_path, dangerous_patterns)
+                    issues_in_file = self._scan_js_file_security(file_path)
                     result["security_issues"].extend(issues_in_file)
                     result["files_analyzed"] += 1
 
@@ -466,30 +494,38 @@ class SecurityGuardianAgent(SDKAgentBase):
 
         return result
 
-    def _scan_js_file_security(self, file_path: Path, patterns: List) -> List[Dict]:
+    def _scan_js_file_security(self, file_path: Path) -> List[Dict]:
         """Scan JavaScript file for security patterns"""
-        import re
-
-        issues_found = []
+        issues_by_pattern = [[] for _ in _JS_DANGEROUS_PATTERNS]
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-
-            for pattern, description, severity in patterns:
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    issues_found.append({
-                        "filename": str(file_path.relative_to(self.project_root)),
-                        "issue_text": description,
-                        "issue_severity": severity,
-                        "line_number": content[:match.start()].count('\n') + 1,
-                        "test_name": "js_security_scan"
-                    })
+            filename = str(file_path.relative_to(self.project_root))
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []  # Nothing to scan, and empty files cannot be mapped
+
+                # Scan the page-cache mapping directly instead of reading and decoding
+                # the file. Matches arrive in order, so line numbers are counted
+                # incrementally instead of re-counting the prefix for each match
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    line_number, counted_to = 1, 0
+                    for match in _JS_SECURITY_RE.finditer(content):
+                        line_number += content[counted_to:match.start()].count(b'\n')
+                        counted_to = match.start()
+                        index = int(match.lastgroup[1:])
+                        _, description, severity = _JS_DANGEROUS_PATTERNS[index]
+                        issues_by_pattern[index].append({
+                            "filename": filename,
+                            "issue_text": description,
+                            "issue_severity": severity,
+                            "line_number": line_number,
+                            "test_name": "js_security_scan"
+                        })
 
         except Exception as e:
             self.logger.warning(f"Could not scan {file_path}: {e}")
 
-        return issues_found
+        # Report grouped by pattern, as before
+        return [issue for issues in issues_by_pattern for issue in issues]
 
     async def _check_security_configs(self) -> Dict[str, Any]:
         """Check security configuration files"""
@@ -3,13 +3,16 @@ Automatic Context Capture for CCOM v2.0
 Lightweight auto-capture using Node.js memory system
 """
 
+import os
 import subprocess
 import json
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from .utils import FileUtils
+
 
 class AutoContextCapture:
     """Automatically captures context from CCOM operations using Node.js memory"""
@@ -23,11 +26,14 @@ class AutoContextCapture:
         if not self.enabled:
             return False
 
+        if command == "remember":
+            # Every capture remembers several entries; spawning node for each one cost
+            # far more than the JSON update itself
+            return self._remember_in_process(feature, description)
+
         try:
             # Use the working Node.js memory system
             cmd = ["node", ".claude/ccom.js", command]
-            if command == "remember" and feature and description:
-                cmd.extend([feature, description])
 
             result = subprocess.run(
                 cmd,
@@ -43,6 +49,56 @@ class AutoContextCapture:
         except Exception:
             return False
 
+    def _remember_in_process(self, feature: str, description: str) -> bool:
+        """In-process port of `node .claude/ccom.js remember <feature> <description>`"""
+        claude_dir = Path.cwd() / ".claude"
+        if not (claude_dir / "ccom.js").exists():
+            return False  # Memory system not installed - node could not load the script
+
+        # ccom.js only receives both arguments when both are set, and joins every
+        # argument into the feature name; with none it just prints its usage
+        if not (feature and description):
+            return True
+        name = f"{feature} {description}"
+
+        memory_file = claude_dir / "memory.json"
+        try:
+            with open(memory_file, encoding="utf-8") as f:
+                memory = json.load(f)
+        except (OSError, ValueError):
+            # First run or corrupted - ccom.js starts a new memory
+            memory = {
+                "version": "0.1",
+                "project": {
+                    "name": Path.cwd().name,
+                    "created": datetime.now(timezone.utc).date().isoformat(),
+                },
+                "features": {},
+            }
+
+        features = memory.get("features")
+        if not isinstance(features, dict):
+            return False
+
+        # Duplicate check on feature names and user terms, as ccom.js does
+        normalized = name.lower().strip()
+        for existing, data in features.items():
+            user_term = data.get("userTerm") if isinstance(data, dict) else None
+            if existing.lower().strip() == normalized or (
+                user_term and user_term.lower().strip() == normalized
+            ):
+                return True
+
+        features[name] = {
+            "created": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+            "description": "",
+            "files": [],
+            "userTerm": name,
+        }
+
+        # Compact and atomic, like every other memory.json writer
+        return FileUtils.safe_write_json(memory_file, memory, indent=None)
+
     def capture_evaluation(self, evaluation_data: Dict):
         """Capture comprehensive evaluation results - KEY METHOD FOR APPLE STORE"""
         if not self.enabled:
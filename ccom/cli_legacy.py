@@ -647,8 +647,9 @@ def capture_command_execution(command_text: str, orchestrator):
         # DUAL-CAPTURE: MCP Keeper + Auto-capture (non-disruptive)
         try:
             # NEW: Try MCP Keeper first (if available)
-            if hasattr(orchestrator, 'mcp_keeper') and orchestrator.mcp_keeper:
-                captured = orchestrator.mcp_keeper.capture_if_mcp_available(output_text)
+            mcp_keeper = orchestrator.get_mcp_keeper() if hasattr(orchestrator, 'get_mcp_keeper') else None
+            if mcp_keeper:
+                captured = mcp_keeper.capture_if_mcp_available(output_text)
 
             # EXISTING: Always run auto-capture as backup/primary
             from .auto_capture import capture_if_evaluation
@@ -671,8 +672,9 @@ def capture_command_execution(command_text: str, orchestrator):
         # DUAL-CAPTURE: Also try capture on errors (in case evaluation had errors)
         try:
             # NEW: Try MCP Keeper for error capture too
-            if hasattr(orchestrator, 'mcp_keeper') and orchestrator.mcp_keeper:
-                orchestrator.mcp_keeper.capture_if_mcp_available(error_output)
+            mcp_keeper = orchestrator.get_mcp_keeper() if hasattr(orchestrator, 'get_mcp_keeper') else None
+            if mcp_keeper:
+                mcp_keeper.capture_if_mcp_available(error_output)
 
             # EXISTING: Auto-capture for errors
             from .auto_capture import capture_if_evaluation
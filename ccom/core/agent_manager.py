@@ -12,6 +12,7 @@ Handles:
 
 import asyncio
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from datetime import datetime
@@ -39,8 +40,8 @@ class AgentManager:
         # Initialize SDK integration
         self.sdk_integration = self._initialize_sdk_integration()
 
-        # Agent execution metrics
-        self.execution_history = []
+        # Agent execution metrics - only the last 100 executions are kept
+        self.execution_history = deque(maxlen=100)
 
     def _initialize_sdk_integration(self) -> SDKIntegrationManager:
         """Initialize SDK Integration Manager for modern agent support"""
@@ -196,12 +197,9 @@ class AgentManager:
                 "context_size": len(str(context))
             }
 
+            # The bounded deque drops the oldest record itself
             self.execution_history.append(execution_record)
 
-            # Keep only last 100 executions
-            if len(self.execution_history) > 100:
-                self.execution_history = self.execution_history[-100:]
-
         except Exception as e:
             self.logger.warning(f"Failed to record execution: {e}")
 
@@ -403,5 +401,5 @@ class AgentManager:
             "success_rate": successful / total,
             "average_execution_time": avg_time,
             "agent_stats": agent_stats,
-            "recent_executions": self.execution_history[-10:]  # Last 10
+            "recent_executions": list(self.execution_history)[-10:]  # Last 10
         }
\ No newline at end of file
@@ -10,6 +10,7 @@ Handles:
 - Context display and reporting
 """
 
+import os
 import json
 import logging
 from pathlib import Path
@@ -17,6 +18,23 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 from ccom.utils import FileUtils, ErrorHandler, Display, SubprocessRunner
+from .memory_manager import classify_feature_health
+
+# Current focus labels keyed by keywords in the latest feature description, in priority order
+_FOCUS_RULES = (
+    (("password reset", "email"), "Password reset and email integration"),
+    (("auth", "authentication"), "Authentication system enhancement"),
+    (("deployment", "production"), "Production deployment"),
+    (("quality", "audit"), "Code quality improvement"),
+)
+
+
+def _latest_feature(features: Dict[str, Any]):
+    """Return the (name, feature) pair added last, without copying the whole dict"""
+    try:
+        return next(reversed(features.items()))
+    except TypeError:
+        return next(reversed(list(features.items())))  # Python 3.7: dict views don't reverse
 
 
 class ContextManager:
@@ -145,18 +163,11 @@ class ContextManager:
         lines = 0
         files = 0
 
-        exclude_patterns = [".git", "node_modules", "__pycache__", ".claude", "dist", "build", ".venv"]
-
         try:
-            for file_path in self.project_root.rglob("*"):
-                if file_path.is_file() and not any(pattern in str(file_path) for pattern in exclude_patterns):
-                    files += 1
-                    if file_path.suffix in [".js", ".py", ".html", ".css", ".ts", ".jsx", ".tsx", ".md"]:
-                        try:
-                            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                                lines += len(f.readlines())
-                        except:
-                            pass
+            for entry in self.file_utils.walk_files(self.project_root):
+                files += 1
+                if os.path.splitext(entry.name)[1] in [".js", ".py", ".html", ".css", ".ts", ".jsx", ".tsx", ".md"]:
+                    lines += self.file_utils.count_lines(entry.path)
 
         except Exception as e:
             self.logger.warning(f"Failed to count project files: {e}")
@@ -186,8 +197,8 @@ class ContextManager:
 
     def get_current_health_status(self) -> Dict[str, str]:
         """Get current health status from memory and analysis"""
-        quality = "Unknown"
-        security = "Unknown"
+        quality = None
+        security = None
         status = "Unknown"
 
         try:
@@ -195,19 +206,22 @@ class ContextManager:
             memory = self.memory_manager.memory
             features = memory.get("features", {})
 
-            # Look for recent quality audits in features
-            for feature_name, feature in features.items():
-                desc = feature.get("description", "").lower()
-                if "quality" in desc:
-                    if "a+" in desc or "99/100" in desc or "98/100" in desc:
-                        quality = "A+ (99/100)"
-                    elif "grade" in desc:
-                        quality = "Enterprise Grade"
-                if "security" in desc:
-                    if "bank-level" in desc or "bank level" in desc:
-                        security = "Bank-level"
-                    elif "zero vulnerabilities" in desc:
-                        security = "Secure"
+            # The most recent labelled features win, so walk newest first and stop
+            # once both labels are found
+            try:
+                newest_first = reversed(features.values())
+            except TypeError:
+                newest_first = reversed(list(features.values()))  # Python 3.7: dict views don't reverse
+            for feature in newest_first:
+                if "quality_grade" in feature or "security_level" in feature:
+                    grades = feature
+                else:
+                    # Recorded before MemoryManager stored the labels
+                    grades = classify_feature_health(feature.get("description", ""))
+                quality = quality or grades.get("quality_grade")
+                security = security or grades.get("security_level")
+                if quality and security:
+                    break
 
             # Check deployment status
             deployments = memory.get("deployments", [])
@@ -255,19 +269,13 @@ class ContextManager:
                 return None
 
             # Get most recent feature
-            latest_feature = list(features.items())[-1]
-            desc = latest_feature[1].get("description", "").lower()
-
-            if "password reset" in desc or "email" in desc:
-                return "Password reset and email integration"
-            elif "auth" in desc or "authentication" in desc:
-                return "Authentication system enhancement"
-            elif "deployment" in desc or "production" in desc:
-                return "Production deployment"
-            elif "quality" in desc or "audit" in desc:
-                return "Code quality improvement"
-            else:
-                return latest_feature[0].replace("_", " ").title()
+            name, feature = _latest_feature(features)
+            desc = feature.get("description", "").lower()
+
+            for keywords, focus in _FOCUS_RULES:
+                if any(keyword in desc for keyword in keywords):
+                    return focus
+            return name.replace("_", " ").title()
 
         except Exception as e:
             self.logger.warning(f"Failed to detect current focus: {e}")
@@ -283,7 +291,7 @@ class ContextManager:
 
             # Analyze recent work to suggest next steps
             if features:
-                latest_desc = list(features.values())[-1].get("description", "").lower()
+                latest_desc = _latest_feature(features)[1].get("description", "").lower()
 
                 if "auth" in latest_desc and "password reset" not in latest_desc:
                     suggestions.append("Add password reset functionality")
@@ -320,18 +328,18 @@ class ContextManager:
                 if (self.project_root / filename).exists():
                     key_files.append(filename)
 
-            # Get most recently modified file
-            files = list(self.project_root.rglob("*"))
-            if files:
-                exclude_patterns = [".git", "node_modules", ".claude", "__pycache__"]
-                valid_files = [
-                    f for f in files
-                    if f.is_file() and not any(pattern in str(f) for pattern in exclude_patterns)
-                ]
-
-                if valid_files:
-                    recent_file = max(valid_files, key=lambda x: x.stat().st_mtime)
-                    recent_changes = f"{recent_file.name} (recently modified)"
+            # Get most recently modified file, streaming the walk with a rolling max
+            best_mtime, recent_file = -1, None
+            for entry in self.file_utils.walk_files(self.project_root):
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > best_mtime:
+                    best_mtime, recent_file = mtime, entry.name
+
+            if recent_file:
+                recent_changes = f"{recent_file} (recently modified)"
 
         except Exception as e:
             self.logger.warning(f"Failed to get file status: {e}")
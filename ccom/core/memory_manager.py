@@ -19,6 +19,30 @@ from typing import Dict, Any, Optional, List
 from ccom.utils import FileUtils, ErrorHandler, Display
 
 
+def classify_feature_health(description: str) -> Dict[str, Optional[str]]:
+    """Derive quality/security labels from a feature description"""
+    desc = (description or "").lower()
+    quality = security = None
+
+    if "quality" in desc:
+        if "a+" in desc or "99/100" in desc or "98/100" in desc:
+            quality = "A+ (99/100)"
+        elif "grade" in desc:
+            quality = "Enterprise Grade"
+    if "security" in desc:
+        if "bank-level" in desc or "bank level" in desc:
+            security = "Bank-level"
+        elif "zero vulnerabilities" in desc:
+            security = "Secure"
+
+    return {"quality_grade": quality, "security_level": security}
+
+
+def _health_fields(description: str) -> Dict[str, str]:
+    """The derived health labels worth storing: only those the description yields"""
+    return {key: value for key, value in classify_feature_health(description).items() if value}
+
+
 class MemoryManager:
     """
     Manages CCOM memory operations with proper separation of concerns
@@ -118,7 +142,7 @@ class MemoryManager:
         if self.memory_file.exists():
             self.file_utils.backup_file(self.memory_file)
 
-        return self.file_utils.safe_write_json(self.memory_file, self._memory)
+        return self.file_utils.safe_write_json(self.memory_file, self._memory, indent=None)
 
     @property
     def memory(self) -> Dict[str, Any]:
@@ -138,7 +162,8 @@ class MemoryManager:
             self._memory["features"][feature_name] = {
                 "description": description,
                 "created": datetime.now().isoformat(),
-                "metadata": metadata or {}
+                "metadata": metadata or {},
+                **_health_fields(description)
             }
 
             return self.save_memory()
@@ -155,6 +180,11 @@ class MemoryManager:
 
             feature = self._memory["features"][feature_name]
             feature.update(updates)
+            if "description" in updates:
+                # Re-derive the labels, dropping any the new description no longer supports
+                for key in ("quality_grade", "security_level"):
+                    feature.pop(key, None)
+                feature.update(_health_fields(updates["description"]))
             feature["lastModified"] = datetime.now().isoformat()
 
             return self.save_memory()
@@ -32,6 +32,23 @@ if sys.platform == "win32":
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'replace')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
 
+# Command phrases and the workflow each selects, checked in order (first match wins)
+_WORKFLOW_NAME_PATTERNS = (
+    ("quality", "quality"),
+    ("security", "security"),
+    ("deploy", "deploy"),
+    ("full pipeline", "full"),
+    ("rag quality", "rag_quality"),
+    ("vector validation", "vector_validation"),
+    ("aws rag", "aws_rag"),
+    ("enterprise rag", "enterprise_rag"),
+    ("angular", "angular_validation"),
+    ("cost optimization", "cost_optimization"),
+    ("s3 security", "s3_security"),
+    ("performance", "performance_optimization"),
+    ("complete stack", "complete_stack"),
+)
+
 
 class CCOMOrchestrator:
     """
@@ -67,6 +84,9 @@ class CCOMOrchestrator:
         # Initialize development hooks for real-time assistance
         self.development_hooks = DevelopmentHooksManager(self.project_root, self.config.get("hooks", {}))
 
+        # Enterprise workflow orchestrator, created on the first enterprise command
+        self._enterprise_workflows = None
+
         # Initialize auto-context capture
         self._init_auto_context()
 
@@ -189,12 +209,18 @@ class CCOMOrchestrator:
             Display.error(f"Validation error: {str(e)}")
             return False
 
+    def _get_enterprise_workflows(self):
+        """Import and create the enterprise workflow orchestrator once, on first use"""
+        if self._enterprise_workflows is None:
+            from ..orchestration.enterprise_workflows import EnterpriseWorkflowOrchestrator
+
+            self._enterprise_workflows = EnterpriseWorkflowOrchestrator(self.project_root)
+        return self._enterprise_workflows
+
     def _handle_enterprise_workflow(self, command: str) -> bool:
         """Handle enterprise workflow execution"""
         try:
-            from ..orchestration.enterprise_workflows import EnterpriseWorkflowOrchestrator
-
-            orchestrator = EnterpriseWorkflowOrchestrator(self.project_root)
+            orchestrator = self._get_enterprise_workflows()
             command_lower = command.lower()
 
             # Determine workflow type
@@ -525,24 +551,7 @@ class CCOMOrchestrator:
 
     def _extract_workflow_name(self, command_lower: str) -> str:
         """Extract workflow name from command"""
-        # Map command patterns to workflow names
-        workflow_mappings = {
-            "quality": "quality",
-            "security": "security",
-            "deploy": "deploy",
-            "full pipeline": "full",
-            "rag quality": "rag_quality",
-            "vector validation": "vector_validation",
-            "aws rag": "aws_rag",
-            "enterprise rag": "enterprise_rag",
-            "angular": "angular_validation",
-            "cost optimization": "cost_optimization",
-            "s3 security": "s3_security",
-            "performance": "performance_optimization",
-            "complete stack": "complete_stack"
-        }
-
-        for pattern, workflow_name in workflow_mappings.items():
+        for pattern, workflow_name in _WORKFLOW_NAME_PATTERNS:
             if pattern in command_lower:
                 return workflow_name
 
@@ -6,8 +6,9 @@ Eliminates code duplication for file operations
 
 import json
 import os
+import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Union, Iterable, Iterator
 import logging
 
 
@@ -18,6 +19,12 @@ class FileUtils:
     Replaces 8+ duplicate file handling implementations across CCOM modules
     """
 
+    # Dependency, VCS, cache and build output directories never worth descending into
+    IGNORED_DIRS = frozenset({
+        ".git", "node_modules", "__pycache__", ".claude", ".venv", "venv",
+        "dist", "build", ".next", "out", "coverage"
+    })
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
@@ -62,7 +69,7 @@ class FileUtils:
         Args:
             file_path: Path to JSON file
             data: Data to write
-            indent: JSON indentation
+            indent: JSON indentation (None writes compact JSON)
 
         Returns:
             True if successful, False otherwise
@@ -71,12 +78,46 @@ class FileUtils:
             path_obj = Path(file_path)
             FileUtils.ensure_directory(path_obj.parent)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            separators = (',', ':') if indent is None else None
+            payload = json.dumps(data, indent=indent, separators=separators, ensure_ascii=False)
+
+            FileUtils.atomic_write_bytes(path_obj, payload.encode('utf-8'))
             return True
         except (OSError, TypeError):
             return False
 
+    @staticmethod
+    def atomic_write_bytes(file_path: Union[str, Path], data: bytes) -> None:
+        """
+        Write a file through a uniquely named sibling temp file and an atomic rename
+
+        Readers never see a partially written file, concurrent writers never share
+        a temp file, and the temp file is removed again if the write fails.
+
+        Args:
+            file_path: Target file path
+            data: Complete new file contents
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path_obj = Path(file_path)
+        tmp_file = tempfile.NamedTemporaryFile(
+            dir=path_obj.parent, prefix=path_obj.name + '.', suffix='.tmp', delete=False
+        )
+        try:
+            with tmp_file:
+                tmp_file.write(data)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_file.name, path_obj)
+        except BaseException:
+            try:
+                os.unlink(tmp_file.name)
+            except OSError:
+                pass
+            raise
+
     @staticmethod
     def safe_read_text(file_path: Union[str, Path], default: str = "") -> str:
         """
@@ -225,6 +266,68 @@ class FileUtils:
 
         return sorted(python_files)
 
+    @staticmethod
+    def walk_files(root: Union[str, Path], suffixes: Optional[Iterable[str]] = None,
+                   ignored: Iterable[str] = IGNORED_DIRS) -> Iterator[os.DirEntry]:
+        """
+        Walk a tree with os.scandir, in the same top-down order as os.walk
+
+        Symlinked directories are not followed, and unreadable directories are
+        skipped. Each DirEntry caches its stat, so callers pay at most one per file.
+
+        Args:
+            root: Directory to walk
+            suffixes: Only yield files with one of these suffixes (all files if None)
+            ignored: Directory names never descended into
+
+        Returns:
+            Iterator of DirEntry objects for the files found
+        """
+        pending = [os.fspath(root)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            sub_dirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignored:
+                            sub_dirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                if suffixes is None or os.path.splitext(entry.name)[1] in suffixes:
+                    yield entry
+            pending.extend(reversed(sub_dirs))
+
+    @staticmethod
+    def count_lines(file_path: Union[str, Path]) -> int:
+        """
+        Count lines in a file from raw 1 MiB chunks, without decoding it
+
+        Args:
+            file_path: File to count
+
+        Returns:
+            Number of lines, or 0 if the file cannot be read
+        """
+        lines = 0
+        last = b"\n"
+        try:
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    lines += chunk.count(b"\n")
+                    last = chunk[-1:]
+        except OSError:
+            return 0
+        # A final line without a trailing newline still counts, as with readlines()
+        return lines + (last != b"\n")
+
     @staticmethod
     def cleanup_temp_files(directory: Union[str, Path], patterns: List[str] = None) -> int:
         """